@@ -12,22 +12,94 @@ This API exposes the most commonly needed Pokemon information through
 intuitive endpoints that LLMs can easily understand and use.
 """
 
+import asyncio
+import functools
 import logging
-from typing import List, Optional, Dict, Any
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 import httpx
-from fastapi import FastAPI, HTTPException
+import orjson
+import redis.asyncio as aioredis
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 POKEAPI_BASE = "https://pokeapi.co/api/v2"
 
+# Response cache; PokeAPI data is effectively immutable, so entries live long.
+# Caching is disabled when REDIS_URL is not set.
+REDIS_URL = os.environ.get("REDIS_URL")
+CACHE_TTL = 86400  # seconds, for single resources (a Pokemon, type, move)
+RAW_CACHE_TTL = 7 * 86400  # seconds, for upstream data shared by several endpoints
+STALE_GRACE = 7 * 86400  # seconds an expired entry is kept to serve if PokeAPI is down
+
+# Per-process cache of parsed results in front of Redis
+LOCAL_CACHE_SIZE = 2048
+LOCAL_CACHE_TTL = 3600
+
+# Prefetch the fixed type chart and the first Pokemon into Redis at startup (set CACHE_WARMUP=0 to skip)
+CACHE_WARMUP = os.environ.get("CACHE_WARMUP", "1") != "0"
+WARMUP_TYPES = [
+    "normal", "fire", "water", "electric", "grass", "ice", "fighting", "poison", "ground",
+    "flying", "psychic", "bug", "rock", "ghost", "dragon", "dark", "steel", "fairy",
+]
+WARMUP_POKEMON_COUNT = 100
+WARMUP_CONCURRENCY = 8  # upstream lookups in flight at once during warmup
+WARMUP_LOCK_TTL = 600  # seconds; only one worker warms per window
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared PokeAPI and Redis clients for the lifetime of the app."""
+    # Shared HTTP/2 client so concurrent upstream calls multiplex over a few connections
+    app.state.client = httpx.AsyncClient(
+        http2=True,
+        base_url=POKEAPI_BASE,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0),
+        timeout=httpx.Timeout(30.0, connect=5.0, write=10.0, pool=5.0),
+        headers={"Accept-Encoding": "gzip, br"},
+    )
+    app.state.redis = aioredis.from_url(REDIS_URL) if REDIS_URL else None
+    # Load the ID table and warm in the background so startup isn't held up by PokeAPI
+    tasks = [asyncio.create_task(ensure_pokemon_ids())]
+    # Only worth it with Redis; a per-worker prefetch would expire within the hour
+    if CACHE_WARMUP and app.state.redis is not None:
+        tasks.append(asyncio.create_task(warm_cache()))
+    try:
+        yield
+    finally:
+        # Let background work (including shielded cache fills) finish cancelling
+        # before the clients it uses are closed
+        pending = [*tasks, *_inflight.values()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await app.state.client.aclose()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+
+
 app = FastAPI(
     title="Pokemon Knowledge API",
     description="Simple Pokemon data access designed for LLM tool usage",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -36,16 +108,242 @@ app.add_middleware(
     allow_methods=["GET"],
     allow_headers=["*"]
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+class LocalCache:
+    """Small LRU cache with per-entry expiry, holding already-parsed values."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + min(ttl, self.ttl), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+local_cache = LocalCache(LOCAL_CACHE_SIZE, LOCAL_CACHE_TTL)
+
+# Lookups currently being filled, so concurrent misses share one upstream call
+_inflight: Dict[str, asyncio.Future] = {}
+
+# Pokemon name -> Pokedex ID, so "Pikachu", "pikachu" and "25" share a cache entry
+pokemon_ids: Dict[str, int] = {}
+POKEMON_IDS_RETRY = 60  # seconds between attempts to load pokemon_ids after a failure
+_pokemon_ids_retry_at = 0.0
+
+
+# Returned by a loader when PokeAPI answers 304 Not Modified
+NOT_MODIFIED = object()
+
+Loader = Callable[[Optional[str]], Awaitable[tuple[Any, Optional[str]]]]
+
+
+async def cached(
+    key: str,
+    ttl: int,
+    fetch: Callable[[], Awaitable[Any]],
+    response: Optional[Response] = None,
+) -> Any:
+    """
+    Return the cached value for key, or compute it with fetch and cache it for ttl seconds.
+
+    If PokeAPI is unreachable and Redis still holds an expired copy, that copy is
+    returned instead and response (if given) is marked with "X-Cache: STALE".
+    """
+    async def load(etag: Optional[str]) -> tuple[Any, Optional[str]]:
+        return await fetch(), None
+
+    return await _cached(key, ttl, load, response)
+
+
+async def cached_resource(
+    key: str,
+    ttl: int,
+    url: str,
+    parse: Callable[[httpx.Response], Any],
+    response: Optional[Response] = None,
+) -> Any:
+    """
+    Like cached(), for a value parsed from the single PokeAPI resource at url.
+
+    The resource's ETag is stored with the entry, so refreshing an expired entry
+    is a conditional GET and an unchanged resource costs a 304 instead of a download.
+    """
+    async def load(etag: Optional[str]) -> tuple[Any, Optional[str]]:
+        upstream = await get_upstream(url, etag)
+        if upstream.status_code == 304:
+            return NOT_MODIFIED, etag
+        return parse(upstream), upstream.headers.get("ETag")
+
+    return await _cached(key, ttl, load, response)
+
+
+async def _cached(key: str, ttl: int, load: Loader, response: Optional[Response]) -> Any:
+    """Serve key from the local cache, or fill it once for all concurrent callers."""
+    value = local_cache.get(key)
+    if value is not None:
+        return value
+
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_fill(key, ttl, load))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one cancelled caller doesn't cancel the fill for the others
+    value, is_stale = await asyncio.shield(future)
+    if is_stale and response is not None:
+        response.headers["X-Cache"] = "STALE"
+    return value
+
+
+async def _fill(key: str, ttl: int, load: Loader) -> tuple[Any, bool]:
+    """Load key from Redis, or from load on a miss, populating both cache levels."""
+    stale = await _redis_get(key)
+    if stale is not None and stale["stale_after"] > time.time():
+        local_cache.set(key, stale["value"], stale["stale_after"] - time.time())
+        return stale["value"], False
+
+    try:
+        value, etag = await load(stale.get("etag") if stale else None)
+    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+        # A missing resource is a real answer; only outages fall back to stale data
+        if stale is None or (isinstance(e, httpx.HTTPStatusError) and e.response.status_code in (404, 410)):
+            raise
+        logger.warning("Serving stale %s after upstream error: %s", key, e)
+        return stale["value"], True
+
+    if value is NOT_MODIFIED:
+        value = stale["value"]
+    local_cache.set(key, value, ttl)
+    entry = {"stale_after": time.time() + ttl, "value": value, "etag": etag}
+    await _redis_set(key, entry, ttl + STALE_GRACE)
+    return value, False
+
+
+async def _redis_get(key: str) -> Optional[Dict[str, Any]]:
+    """Read a cache entry from Redis, treating Redis errors as a miss."""
+    redis = app.state.redis
+    if redis is None:
+        return None
+    try:
+        hit = await redis.get(key)
+    except aioredis.RedisError as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+    return orjson.loads(hit) if hit is not None else None
+
+
+async def _redis_set(key: str, entry: Dict[str, Any], ttl: int) -> None:
+    """Write a cache entry to Redis, logging rather than raising on Redis errors."""
+    redis = app.state.redis
+    if redis is None:
+        return
+    try:
+        await redis.set(key, orjson.dumps(entry), ex=ttl)
+    except aioredis.RedisError as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+
+
+async def get_upstream(url: str, etag: Optional[str] = None) -> httpx.Response:
+    """
+    GET a PokeAPI URL, raising httpx.HTTPStatusError on an error status.
+
+    With an etag the request is conditional and may come back as 304 Not Modified.
+    """
+    logger.debug("Fetching %s", url)
+    headers = {"If-None-Match": etag} if etag else None
+    response = await app.state.client.get(url, headers=headers)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
 
-client = httpx.AsyncClient(timeout=30.0)
 
-@app.on_event("shutdown")
-async def shutdown():
-    await client.aclose()
+def upstream_error(e: httpx.HTTPStatusError, what: str) -> HTTPException:
+    """Map a PokeAPI error status to the HTTPException returned to the client."""
+    code = e.response.status_code
+    if code == 404:
+        return HTTPException(404, f"{what} not found")
+    # Client errors pass through; anything else (3xx, 5xx) is a bad gateway response
+    return HTTPException(code if 400 <= code < 500 else 502, f"PokeAPI returned {code}")
 
 
-@app.get("/get_pokemon_info/{name_or_id}")
-async def get_pokemon_info(name_or_id: str) -> Dict[str, Any]:
+async def get_type_data(type_name: str, response: Optional[Response] = None) -> Dict[str, Any]:
+    """
+    Get the damage relations and Pokemon names of a PokeAPI type.
+
+    Cached separately from the endpoint results so that both type endpoints,
+    and every search limit, are served from a single cache entry. Only the
+    names are kept, since the full type resource is large and mostly URLs.
+    """
+    key = type_name.lower()
+
+    def parse(type_response: httpx.Response) -> Dict[str, Any]:
+        type_data = orjson.loads(type_response.content)
+        return {
+            "damage_relations": {
+                relation: [t["name"] for t in types]
+                for relation, types in type_data["damage_relations"].items()
+            },
+            "pokemon": [p["pokemon"]["name"] for p in type_data["pokemon"]],
+        }
+
+    return await cached_resource(f"typedata:{key}", RAW_CACHE_TTL, f"/type/{key}", parse, response)
+
+
+async def ensure_pokemon_ids() -> None:
+    """
+    Fill pokemon_ids from the PokeAPI Pokemon list if it is still empty.
+
+    Failures are logged, and the load is retried at most every POKEMON_IDS_RETRY seconds.
+    """
+    global _pokemon_ids_retry_at
+    if pokemon_ids or time.monotonic() < _pokemon_ids_retry_at:
+        return
+    _pokemon_ids_retry_at = time.monotonic() + POKEMON_IDS_RETRY
+
+    def parse(list_response: httpx.Response) -> Dict[str, int]:
+        return {
+            p["name"]: int(p["url"].rstrip("/").rsplit("/", 1)[1])
+            for p in orjson.loads(list_response.content)["results"]
+        }
+
+    try:
+        pokemon_ids.update(
+            await cached_resource("pokemonids", RAW_CACHE_TTL, "/pokemon?limit=2000", parse)
+        )
+    except Exception as e:
+        logger.warning("Failed to load Pokemon IDs: %s", e)
+
+
+async def pokemon_key(name_or_id: str) -> str:
+    """Normalize a Pokemon name or Pokedex number to the canonical ID when known."""
+    key = name_or_id.strip().lower()
+    if key.isascii() and key.isdigit():
+        return str(int(key))
+    if key not in pokemon_ids:
+        await ensure_pokemon_ids()
+    return str(pokemon_ids.get(key, key))
+
+
+# response_model=None: skip validating our own dicts against a model inferred from the annotation
+@app.get("/get_pokemon_info/{name_or_id}", response_model=None)
+async def get_pokemon_info(name_or_id: str, response: Response) -> Dict[str, Any]:
     """
     Get comprehensive information about a specific Pokemon.
     
@@ -66,17 +364,23 @@ async def get_pokemon_info(name_or_id: str) -> Dict[str, Any]:
     Returns:
         Complete Pokemon data including stats, types, abilities, and moves
     """
-    try:
-        # Get basic Pokemon data
-        response = await client.get(f"{POKEAPI_BASE}/pokemon/{name_or_id.lower()}")
-        if response.status_code == 404:
-            raise HTTPException(404, f"Pokemon '{name_or_id}' not found")
+    async def fetch() -> Dict[str, Any]:
+        # Species accepts the same name/ID for most Pokemon, so fetch both at once
+        pokemon_response, species_response = await asyncio.gather(
+            get_upstream(f"/pokemon/{key}"),
+            get_upstream(f"/pokemon-species/{key}"),
+            return_exceptions=True,
+        )
+        if isinstance(pokemon_response, BaseException):
+            raise pokemon_response
         
-        pokemon = response.json()
+        pokemon = orjson.loads(pokemon_response.content)
         
-        # Get species data for additional info
-        species_response = await client.get(pokemon["species"]["url"])
-        species = species_response.json()
+        # Alternate forms (e.g. "deoxys-attack") need the species URL instead
+        species = None if isinstance(species_response, BaseException) else orjson.loads(species_response.content)
+        if species is None or species["name"] != pokemon["species"]["name"]:
+            species_response = await get_upstream(pokemon["species"]["url"])
+            species = orjson.loads(species_response.content)
         
         # Extract key information in a simplified format
         return {
@@ -97,15 +401,21 @@ async def get_pokemon_info(name_or_id: str) -> Dict[str, Any]:
             "color": species["color"]["name"],
             "shape": species["shape"]["name"] if species["shape"] else None,
         }
+
+    try:
+        key = await pokemon_key(name_or_id)
+        return await cached(f"pokeinfo:{key}", CACHE_TTL, fetch, response)
     except HTTPException:
         raise
+    except httpx.HTTPStatusError as e:
+        raise upstream_error(e, f"Pokemon '{name_or_id}'")
     except Exception as e:
-        logger.error(f"Error fetching Pokemon {name_or_id}: {e}")
+        logger.error("Error fetching Pokemon %s: %s", name_or_id, e)
         raise HTTPException(500, "Failed to retrieve Pokemon data")
 
 
-@app.get("/compare_pokemon_stats/{pokemon1}/{pokemon2}")
-async def compare_pokemon_stats(pokemon1: str, pokemon2: str) -> Dict[str, Any]:
+@app.get("/compare_pokemon_stats/{pokemon1}/{pokemon2}", response_model=None)
+async def compare_pokemon_stats(pokemon1: str, pokemon2: str, response: Response) -> Dict[str, Any]:
     """
     Compare the battle stats between two Pokemon.
     
@@ -128,42 +438,51 @@ async def compare_pokemon_stats(pokemon1: str, pokemon2: str) -> Dict[str, Any]:
     """
     try:
         # Get both Pokemon
-        poke1_data = await get_pokemon_info(pokemon1)
-        poke2_data = await get_pokemon_info(pokemon2)
+        poke1_data, poke2_data = await asyncio.gather(
+            get_pokemon_info(pokemon1, response),
+            get_pokemon_info(pokemon2, response),
+        )
+        
+        name1, name2 = poke1_data["name"], poke2_data["name"]
+        stats2 = poke2_data["stats"]
         
-        # Calculate stat differences
+        # Calculate stat differences and totals in one pass
         stat_comparison = {}
-        for stat_name in poke1_data["stats"]:
-            val1 = poke1_data["stats"][stat_name]
-            val2 = poke2_data["stats"][stat_name]
+        total1 = total2 = 0
+        for stat_name, val1 in poke1_data["stats"].items():
+            val2 = stats2[stat_name]
+            total1 += val1
+            total2 += val2
             stat_comparison[stat_name] = {
-                poke1_data["name"]: val1,
-                poke2_data["name"]: val2,
+                name1: val1,
+                name2: val2,
                 "difference": val1 - val2,
-                "winner": poke1_data["name"] if val1 > val2 else poke2_data["name"] if val2 > val1 else "tie"
+                "winner": name1 if val1 > val2 else name2 if val2 > val1 else "tie"
             }
         
         return {
             "pokemon1": {
-                "name": poke1_data["name"],
+                "name": name1,
                 "types": poke1_data["types"],
-                "total_stats": sum(poke1_data["stats"].values())
+                "total_stats": total1
             },
             "pokemon2": {
-                "name": poke2_data["name"], 
+                "name": name2, 
                 "types": poke2_data["types"],
-                "total_stats": sum(poke2_data["stats"].values())
+                "total_stats": total2
             },
             "stat_comparison": stat_comparison,
-            "overall_winner": poke1_data["name"] if sum(poke1_data["stats"].values()) > sum(poke2_data["stats"].values()) else poke2_data["name"]
+            "overall_winner": name1 if total1 > total2 else name2
         }
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error comparing {pokemon1} vs {pokemon2}: {e}")
+        logger.error("Error comparing %s vs %s: %s", pokemon1, pokemon2, e)
         raise HTTPException(500, "Failed to compare Pokemon")
 
 
-@app.get("/get_type_effectiveness/{attacking_type}")
-async def get_type_effectiveness(attacking_type: str) -> Dict[str, Any]:
+@app.get("/get_type_effectiveness/{attacking_type}", response_model=None)
+async def get_type_effectiveness(attacking_type: str, response: Response) -> Dict[str, Any]:
     """
     Get type effectiveness information for a Pokemon type.
     
@@ -184,31 +503,33 @@ async def get_type_effectiveness(attacking_type: str) -> Dict[str, Any]:
         Complete type effectiveness chart for the given type
     """
     try:
-        response = await client.get(f"{POKEAPI_BASE}/type/{attacking_type.lower()}")
-        if response.status_code == 404:
-            raise HTTPException(404, f"Type '{attacking_type}' not found")
-        
-        type_data = response.json()
+        # Built from the cached type data on each call, so a stale copy is reported
+        # to this caller and never re-cached as fresh
+        type_data = await get_type_data(attacking_type, response)
         damage_relations = type_data["damage_relations"]
         
         return {
             "type": attacking_type.title(),
-            "super_effective_against": [t["name"] for t in damage_relations["double_damage_to"]],
-            "not_very_effective_against": [t["name"] for t in damage_relations["half_damage_to"]],
-            "no_effect_against": [t["name"] for t in damage_relations["no_damage_to"]],
-            "weak_to": [t["name"] for t in damage_relations["double_damage_from"]],
-            "resists": [t["name"] for t in damage_relations["half_damage_from"]],
-            "immune_to": [t["name"] for t in damage_relations["no_damage_from"]]
+            "super_effective_against": damage_relations["double_damage_to"],
+            "not_very_effective_against": damage_relations["half_damage_to"],
+            "no_effect_against": damage_relations["no_damage_to"],
+            "weak_to": damage_relations["double_damage_from"],
+            "resists": damage_relations["half_damage_from"],
+            "immune_to": damage_relations["no_damage_from"]
         }
     except HTTPException:
         raise
+    except httpx.HTTPStatusError as e:
+        raise upstream_error(e, f"Type '{attacking_type}'")
     except Exception as e:
-        logger.error(f"Error fetching type {attacking_type}: {e}")
+        logger.error("Error fetching type %s: %s", attacking_type, e)
         raise HTTPException(500, "Failed to retrieve type data")
 
 
-@app.get("/search_pokemon_by_type/{type_name}")
-async def search_pokemon_by_type(type_name: str, limit: int = 20) -> Dict[str, List[str]]:
+@app.get("/search_pokemon_by_type/{type_name}", response_model=None)
+async def search_pokemon_by_type(
+    type_name: str, response: Response, limit: int = Query(20, ge=1)
+) -> Dict[str, Any]:
     """
     Find all Pokemon of a specific type.
     
@@ -230,12 +551,9 @@ async def search_pokemon_by_type(type_name: str, limit: int = 20) -> Dict[str, L
         List of Pokemon names that have the specified type
     """
     try:
-        response = await client.get(f"{POKEAPI_BASE}/type/{type_name.lower()}")
-        if response.status_code == 404:
-            raise HTTPException(404, f"Type '{type_name}' not found")
-        
-        type_data = response.json()
-        pokemon_list = [p["pokemon"]["name"].title() for p in type_data["pokemon"][:limit]]
+        # A cheap slice of the cached type data, so it isn't cached per limit either
+        type_data = await get_type_data(type_name, response)
+        pokemon_list = [name.title() for name in type_data["pokemon"][:limit]]
         
         return {
             "type": type_name.title(),
@@ -245,13 +563,15 @@ async def search_pokemon_by_type(type_name: str, limit: int = 20) -> Dict[str, L
         }
     except HTTPException:
         raise
+    except httpx.HTTPStatusError as e:
+        raise upstream_error(e, f"Type '{type_name}'")
     except Exception as e:
-        logger.error(f"Error searching type {type_name}: {e}")
+        logger.error("Error searching type %s: %s", type_name, e)
         raise HTTPException(500, "Failed to search Pokemon by type")
 
 
-@app.get("/get_move_details/{move_name}")
-async def get_move_details(move_name: str) -> Dict[str, Any]:
+@app.get("/get_move_details/{move_name}", response_model=None)
+async def get_move_details(move_name: str, response: Response) -> Dict[str, Any]:
     """
     Get detailed information about a Pokemon move.
     
@@ -270,12 +590,10 @@ async def get_move_details(move_name: str) -> Dict[str, Any]:
     Returns:
         Complete move information including stats and effects
     """
-    try:
-        response = await client.get(f"{POKEAPI_BASE}/move/{move_name.lower().replace(' ', '-')}")
-        if response.status_code == 404:
-            raise HTTPException(404, f"Move '{move_name}' not found")
-        
-        move = response.json()
+    key = move_name.lower().replace(" ", "-")
+
+    def parse(move_response: httpx.Response) -> Dict[str, Any]:
+        move = orjson.loads(move_response.content)
         
         # Get English effect text
         effect_text = "No description available"
@@ -296,13 +614,54 @@ async def get_move_details(move_name: str) -> Dict[str, Any]:
             "effect_chance": move["effect_chance"],
             "generation": move["generation"]["name"]
         }
+
+    try:
+        return await cached_resource(f"moveinfo:{key}", CACHE_TTL, f"/move/{key}", parse, response)
     except HTTPException:
         raise
+    except httpx.HTTPStatusError as e:
+        raise upstream_error(e, f"Move '{move_name}'")
     except Exception as e:
-        logger.error(f"Error fetching move {move_name}: {e}")
+        logger.error("Error fetching move %s: %s", move_name, e)
         raise HTTPException(500, "Failed to retrieve move data")
 
 
+async def warm_cache() -> None:
+    """
+    Prefetch every type and the first Pokemon into Redis.
+
+    A lock makes a single worker do the warmup, and keys already in Redis are skipped.
+    """
+    redis = app.state.redis
+    try:
+        if not await redis.set("warmup:lock", os.getpid(), nx=True, ex=WARMUP_LOCK_TTL):
+            logger.info("Cache warmup skipped: another worker holds the lock")
+            return
+    except aioredis.RedisError as e:
+        logger.warning("Cache warmup skipped: %s", e)
+        return
+
+    semaphore = asyncio.Semaphore(WARMUP_CONCURRENCY)
+
+    async def warm(key: str, lookup: Callable[[], Awaitable[Any]]) -> None:
+        async with semaphore:
+            if await redis.exists(key):
+                return
+            await lookup()
+
+    lookups = [
+        warm(f"typedata:{t}", functools.partial(get_type_data, t))
+        for t in WARMUP_TYPES
+    ]
+    lookups += [
+        warm(f"pokeinfo:{i}", functools.partial(get_pokemon_info, str(i), Response()))
+        for i in range(1, WARMUP_POKEMON_COUNT + 1)
+    ]
+    results = await asyncio.gather(*lookups, return_exceptions=True)
+    failed = sum(isinstance(r, Exception) for r in results)
+    logger.info("Cache warmup done: %s lookups, %s failed", len(results), failed)
+
+
 @app.get("/")
 async def root():
     """API overview and available endpoints."""
@@ -328,4 +687,11 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # uvicorn picks uvloop and httptools automatically when installed (uvicorn[standard]);
+    # multiple workers need the app as an import string
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )